@@ -60,7 +60,7 @@ type Repository interface {
 	CreateAPIKey(ctx context.Context, userID int, name, keyHash, prefix string) error
 
 	// Model Aliases
-	UpsertModelAlias(ctx context.Context, userID int, alias, targetModel string, providerKeyID int, fallbackAliasID *int, useLightModel bool, lightModelThreshold int, lightModel *string) error
+	UpsertModelAlias(ctx context.Context, userID int, alias, targetModel string, providerKeyID int, fallbackAliasID *int, useLightModel bool, lightModelThreshold int, lightModel *string) (int, error)
 	GetModelAlias(ctx context.Context, userID int, alias string) (*ModelAlias, error)
 	GetModelAliasByID(ctx context.Context, id int) (string, error)
 	ListModelAliases(ctx context.Context, userID int) ([]ModelAlias, error)
@@ -115,7 +115,7 @@ func (r *PostgresRepository) CreateAPIKey(ctx context.Context, userID int, name,
 	return err
 }
 
-func (r *PostgresRepository) UpsertModelAlias(ctx context.Context, userID int, alias, targetModel string, providerKeyID int, fallbackAliasID *int, useLightModel bool, lightModelThreshold int, lightModel *string) error {
+func (r *PostgresRepository) UpsertModelAlias(ctx context.Context, userID int, alias, targetModel string, providerKeyID int, fallbackAliasID *int, useLightModel bool, lightModelThreshold int, lightModel *string) (int, error) {
 	sql := `INSERT INTO model_aliases (user_id, alias, target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model)
 	        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
 			ON CONFLICT (user_id, alias)
@@ -124,16 +124,18 @@ func (r *PostgresRepository) UpsertModelAlias(ctx context.Context, userID int, a
 						  fallback_alias_id = EXCLUDED.fallback_alias_id,
 						  use_light_model = EXCLUDED.use_light_model,
 						  light_model_threshold = EXCLUDED.light_model_threshold,
-						  light_model = EXCLUDED.light_model`
-	_, err := r.pool.Exec(ctx, sql, userID, alias, targetModel, providerKeyID, fallbackAliasID, useLightModel, lightModelThreshold, lightModel)
-	return err
+						  light_model = EXCLUDED.light_model
+			RETURNING id`
+	var id int
+	err := r.pool.QueryRow(ctx, sql, userID, alias, targetModel, providerKeyID, fallbackAliasID, useLightModel, lightModelThreshold, lightModel).Scan(&id)
+	return id, err
 }
 
 func (r *PostgresRepository) GetModelAlias(ctx context.Context, userID int, alias string) (*ModelAlias, error) {
 	var a ModelAlias
 	err := r.pool.QueryRow(ctx,
-		"SELECT target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model FROM model_aliases WHERE user_id = $1 AND alias = $2",
-		userID, alias).Scan(&a.TargetModel, &a.ProviderKeyID, &a.FallbackAliasID, &a.UseLightModel, &a.LightModelThreshold, &a.LightModel)
+		"SELECT id, target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model FROM model_aliases WHERE user_id = $1 AND alias = $2",
+		userID, alias).Scan(&a.ID, &a.TargetModel, &a.ProviderKeyID, &a.FallbackAliasID, &a.UseLightModel, &a.LightModelThreshold, &a.LightModel)
 	if err != nil {
 		return nil, err
 	}
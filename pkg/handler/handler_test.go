@@ -72,10 +72,10 @@ func TestProxyHandler_Anthropic(t *testing.T) {
 
 	// Expectations
 	// 1. Lookup Model Alias
-	mockDB.ExpectQuery("SELECT target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model FROM model_aliases").
+	mockDB.ExpectQuery("SELECT id, target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model FROM model_aliases").
 		WithArgs(userID, "my-alias").
-		WillReturnRows(mockDB.NewRows([]string{"target_model", "provider_key_id", "fallback_alias_id", "use_light_model", "light_model_threshold", "light_model"}).
-			AddRow("claude-3-opus", 55, nil, false, 100, nil))
+		WillReturnRows(mockDB.NewRows([]string{"id", "target_model", "provider_key_id", "fallback_alias_id", "use_light_model", "light_model_threshold", "light_model"}).
+			AddRow(1, "claude-3-opus", 55, nil, false, 100, nil))
 
 	// 2. Fetch Provider Type
 	mockDB.ExpectQuery("SELECT provider, encrypted_key FROM provider_keys").
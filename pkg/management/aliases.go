@@ -3,6 +3,7 @@ package management
 import (
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"log"
 	"net/http"
@@ -10,6 +11,7 @@ import (
 	"tokentracer-proxy/pkg/db"
 
 	"github.com/go-chi/chi/v5"
+	"github.com/jackc/pgx/v5"
 )
 
 type ModelAliasRequest struct {
@@ -23,7 +25,27 @@ type ModelAliasRequest struct {
 	LightModel          *string `json:"light_model"`
 }
 
-// UpsertModelAlias creates or updates a routing rule
+func newModelAliasResponse(a *db.ModelAlias) ModelAliasRequest {
+	return ModelAliasRequest{
+		ID:                  a.ID,
+		Alias:               a.Alias,
+		TargetModel:         a.TargetModel,
+		ProviderKeyID:       a.ProviderKeyID,
+		FallbackAliasID:     a.FallbackAliasID,
+		UseLightModel:       a.UseLightModel,
+		LightModelThreshold: a.LightModelThreshold,
+		LightModel:          a.LightModel,
+	}
+}
+
+func writeModelAlias(w http.ResponseWriter, alias ModelAliasRequest) {
+	w.Header().Set("Content-Type", "application/json")
+	if err := json.NewEncoder(w).Encode(alias); err != nil {
+		log.Printf("model alias: encode response error: %v", err)
+	}
+}
+
+// UpsertModelAlias creates or updates a routing rule and returns the saved row
 func UpsertModelAlias(w http.ResponseWriter, r *http.Request) {
 	userID := r.Context().Value(auth.KeyUser).(int)
 
@@ -54,16 +76,35 @@ func UpsertModelAlias(w http.ResponseWriter, r *http.Request) {
 		req.LightModel = nil
 	}
 
-	err := db.Repo.UpsertModelAlias(context.Background(), userID, req.Alias, req.TargetModel, req.ProviderKeyID, req.FallbackAliasID, req.UseLightModel, req.LightModelThreshold, req.LightModel)
+	id, err := db.Repo.UpsertModelAlias(context.Background(), userID, req.Alias, req.TargetModel, req.ProviderKeyID, req.FallbackAliasID, req.UseLightModel, req.LightModelThreshold, req.LightModel)
 	if err != nil {
 		log.Printf("upsert model alias error: %v", err)
 		http.Error(w, "Failed to save model alias", http.StatusInternalServerError)
 		return
 	}
-	w.WriteHeader(http.StatusOK)
+	req.ID = id
+	writeModelAlias(w, req)
 }
 
-// PatchModelAlias updates specific fields of a routing rule
+// GetAlias returns a single routing rule by name
+func GetAlias(w http.ResponseWriter, r *http.Request) {
+	userID := r.Context().Value(auth.KeyUser).(int)
+	aliasName := chi.URLParam(r, "alias")
+
+	alias, err := db.Repo.GetModelAlias(context.Background(), userID, aliasName)
+	if errors.Is(err, pgx.ErrNoRows) {
+		http.Error(w, "Model alias not found", http.StatusNotFound)
+		return
+	}
+	if err != nil {
+		log.Printf("get model alias %q error for user %d: %v", aliasName, userID, err)
+		http.Error(w, "DB Error", http.StatusInternalServerError)
+		return
+	}
+	writeModelAlias(w, newModelAliasResponse(alias))
+}
+
+// PatchModelAlias updates specific fields of a routing rule and returns the updated row
 func PatchModelAlias(w http.ResponseWriter, r *http.Request) {
 	userID := r.Context().Value(auth.KeyUser).(int)
 	aliasName := chi.URLParam(r, "alias")
@@ -80,7 +121,18 @@ func PatchModelAlias(w http.ResponseWriter, r *http.Request) {
 		http.Error(w, "Failed to update model alias", http.StatusInternalServerError)
 		return
 	}
-	w.WriteHeader(http.StatusOK)
+
+	alias, err := db.Repo.GetModelAlias(context.Background(), userID, aliasName)
+	if errors.Is(err, pgx.ErrNoRows) {
+		http.Error(w, "Model alias not found", http.StatusNotFound)
+		return
+	}
+	if err != nil {
+		log.Printf("patch model alias: reload %q error: %v", aliasName, err)
+		http.Error(w, "Failed to update model alias", http.StatusInternalServerError)
+		return
+	}
+	writeModelAlias(w, newModelAliasResponse(alias))
 }
 
 // ListAliases returns all routing rules
@@ -95,17 +147,8 @@ func ListAliases(w http.ResponseWriter, r *http.Request) {
 	}
 
 	var aliases []ModelAliasRequest
-	for _, a := range results {
-		aliases = append(aliases, ModelAliasRequest{
-			ID:                  a.ID,
-			Alias:               a.Alias,
-			TargetModel:         a.TargetModel,
-			ProviderKeyID:       a.ProviderKeyID,
-			FallbackAliasID:     a.FallbackAliasID,
-			UseLightModel:       a.UseLightModel,
-			LightModelThreshold: a.LightModelThreshold,
-			LightModel:          a.LightModel,
-		})
+	for i := range results {
+		aliases = append(aliases, newModelAliasResponse(&results[i]))
 	}
 	w.Header().Set("Content-Type", "application/json")
 	if err := json.NewEncoder(w).Encode(aliases); err != nil {
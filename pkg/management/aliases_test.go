@@ -0,0 +1,167 @@
+package management_test
+
+import (
+	"bytes"
+	"context"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"tokentracer-proxy/pkg/auth"
+	"tokentracer-proxy/pkg/db"
+	"tokentracer-proxy/pkg/management"
+
+	"github.com/go-chi/chi/v5"
+	"github.com/jackc/pgx/v5"
+	"github.com/pashagolub/pgxmock/v4"
+)
+
+const selectAliasSQL = "SELECT id, target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model FROM model_aliases"
+
+var aliasColumns = []string{"id", "target_model", "provider_key_id", "fallback_alias_id", "use_light_model", "light_model_threshold", "light_model"}
+
+func setupMockRepo(t *testing.T) pgxmock.PgxPoolIface {
+	mock, err := pgxmock.NewPool()
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	// Replace global Repo
+	originalRepo := db.Repo
+	db.Repo = db.NewPostgresRepository(mock)
+	t.Cleanup(func() {
+		db.Repo = originalRepo
+		mock.Close()
+	})
+	return mock
+}
+
+// serve routes the request through the management router so URL params resolve
+func serve(method, path string, body []byte, userID int) *httptest.ResponseRecorder {
+	r := chi.NewRouter()
+	management.RegisterRoutes(r)
+
+	req := httptest.NewRequest(method, path, bytes.NewBuffer(body))
+	req = req.WithContext(context.WithValue(req.Context(), auth.KeyUser, userID))
+	w := httptest.NewRecorder()
+	r.ServeHTTP(w, req)
+	return w
+}
+
+func decodeAlias(t *testing.T, w *httptest.ResponseRecorder) management.ModelAliasRequest {
+	var got management.ModelAliasRequest
+	if err := json.NewDecoder(w.Body).Decode(&got); err != nil {
+		t.Fatalf("decode response: %v", err)
+	}
+	return got
+}
+
+func TestUpsertModelAlias_ReturnsID(t *testing.T) {
+	mock := setupMockRepo(t)
+	userID := 123
+
+	mock.ExpectQuery("INSERT INTO model_aliases").
+		WithArgs(userID, "my-alias", "gpt-4", 55, pgxmock.AnyArg(), false, 0, pgxmock.AnyArg()).
+		WillReturnRows(mock.NewRows([]string{"id"}).AddRow(7))
+
+	body, _ := json.Marshal(map[string]interface{}{
+		"alias": "my-alias", "target_model": "gpt-4", "provider_key_id": 55,
+	})
+	w := serve("POST", "/aliases", body, userID)
+
+	if w.Code != http.StatusOK {
+		t.Fatalf("expected status 200, got %d. Body: %s", w.Code, w.Body.String())
+	}
+	got := decodeAlias(t, w)
+	if got.ID != 7 || got.Alias != "my-alias" || got.TargetModel != "gpt-4" {
+		t.Errorf("unexpected alias in response: %+v", got)
+	}
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("there were unfulfilled expectations: %s", err)
+	}
+}
+
+func TestGetAlias(t *testing.T) {
+	mock := setupMockRepo(t)
+	userID := 123
+
+	t.Run("Found", func(t *testing.T) {
+		mock.ExpectQuery(selectAliasSQL).
+			WithArgs(userID, "my-alias").
+			WillReturnRows(mock.NewRows(aliasColumns).AddRow(7, "gpt-4", 55, nil, false, 0, nil))
+
+		w := serve("GET", "/aliases/my-alias", nil, userID)
+
+		if w.Code != http.StatusOK {
+			t.Fatalf("expected status 200, got %d. Body: %s", w.Code, w.Body.String())
+		}
+		got := decodeAlias(t, w)
+		if got.ID != 7 || got.Alias != "my-alias" || got.TargetModel != "gpt-4" || got.ProviderKeyID != 55 {
+			t.Errorf("unexpected alias in response: %+v", got)
+		}
+		if err := mock.ExpectationsWereMet(); err != nil {
+			t.Errorf("there were unfulfilled expectations: %s", err)
+		}
+	})
+
+	t.Run("Not Found", func(t *testing.T) {
+		mock.ExpectQuery(selectAliasSQL).
+			WithArgs(userID, "missing").
+			WillReturnError(pgx.ErrNoRows)
+
+		w := serve("GET", "/aliases/missing", nil, userID)
+
+		if w.Code != http.StatusNotFound {
+			t.Errorf("expected status 404, got %d", w.Code)
+		}
+		if err := mock.ExpectationsWereMet(); err != nil {
+			t.Errorf("there were unfulfilled expectations: %s", err)
+		}
+	})
+}
+
+func TestPatchModelAlias(t *testing.T) {
+	mock := setupMockRepo(t)
+	userID := 123
+	body, _ := json.Marshal(map[string]interface{}{"target_model": "gpt-4o"})
+
+	t.Run("Returns Reloaded Row", func(t *testing.T) {
+		mock.ExpectExec("UPDATE model_aliases SET target_model").
+			WithArgs(userID, "my-alias", "gpt-4o").
+			WillReturnResult(pgxmock.NewResult("UPDATE", 1))
+		mock.ExpectQuery(selectAliasSQL).
+			WithArgs(userID, "my-alias").
+			WillReturnRows(mock.NewRows(aliasColumns).AddRow(7, "gpt-4o", 55, nil, false, 0, nil))
+
+		w := serve("PATCH", "/aliases/my-alias", body, userID)
+
+		if w.Code != http.StatusOK {
+			t.Fatalf("expected status 200, got %d. Body: %s", w.Code, w.Body.String())
+		}
+		got := decodeAlias(t, w)
+		if got.ID != 7 || got.TargetModel != "gpt-4o" || got.ProviderKeyID != 55 {
+			t.Errorf("unexpected alias in response: %+v", got)
+		}
+		if err := mock.ExpectationsWereMet(); err != nil {
+			t.Errorf("there were unfulfilled expectations: %s", err)
+		}
+	})
+
+	t.Run("Unknown Alias", func(t *testing.T) {
+		mock.ExpectExec("UPDATE model_aliases SET target_model").
+			WithArgs(userID, "missing", "gpt-4o").
+			WillReturnResult(pgxmock.NewResult("UPDATE", 0))
+		mock.ExpectQuery(selectAliasSQL).
+			WithArgs(userID, "missing").
+			WillReturnError(pgx.ErrNoRows)
+
+		w := serve("PATCH", "/aliases/missing", body, userID)
+
+		if w.Code != http.StatusNotFound {
+			t.Errorf("expected status 404, got %d", w.Code)
+		}
+		if err := mock.ExpectationsWereMet(); err != nil {
+			t.Errorf("there were unfulfilled expectations: %s", err)
+		}
+	})
+}
@@ -44,6 +44,7 @@ func RegisterRoutes(r chi.Router) {
 
 	r.Post("/aliases", UpsertModelAlias)
 	r.Get("/aliases", ListAliases)
+	r.Get("/aliases/{alias}", GetAlias)
 	r.Patch("/aliases/{alias}", PatchModelAlias)
 
 	r.Get("/usage", GetUsageStats)
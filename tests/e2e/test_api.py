@@ -2,13 +2,92 @@
 
 Requires the full docker-compose stack (postgres + redis + app) to be running.
 Run with: pytest -v test_api.py
+
+The tests are I/O-bound, so classes can run in parallel with pytest-xdist:
+    pytest -v -n auto --dist=loadscope test_api.py
+Each worker creates its own module-scoped user, so workers never share rows.
+
+Every test is marked ``e2e`` so fast lanes can deselect them with -m "not e2e".
 """
 
+import itertools
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
+import orjson
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
+
+pytestmark = pytest.mark.e2e
+
+_counter = itertools.count()
+
+# (connect, read) seconds; a hung server should fail a test, not stall the suite
+DEFAULT_TIMEOUT = (2, 10)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _TimeoutSession(requests.Session):
+    """Session that applies DEFAULT_TIMEOUT unless a call passes its own."""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+def _uid():
+    """Short per-process id for names scoped to the module's user (aliases, keys)."""
+    return str(next(_counter))
+
+
+def _post(http, url, payload, headers=None):
+    """POST a JSON body encoded with orjson on the shared session."""
+    return http.post(url, data=orjson.dumps(payload), headers=headers)
+
+
+def _create_alias(http, base_url, headers, alias, target_model, pk_id, **extras):
+    """Create (or upsert) an alias; extra keyword args are sent as optional fields.
+
+    The response echoes the request plus the stored id, so assertions on stored
+    values must read the row back with ``_get_alias``.
+    """
+    return _post(
+        http,
+        f"{base_url}/manage/aliases",
+        headers=headers,
+        payload={
+            "alias": alias,
+            "target_model": target_model,
+            "provider_key_id": pk_id,
+            **extras,
+        },
+    )
+
+
+def _get_alias(http, base_url, headers, alias):
+    """Read a single alias back from the database by name."""
+    r = http.get(f"{base_url}/manage/aliases/{alias}", headers=headers)
+    assert r.status_code == 200, f"Get alias {alias} failed: {r.status_code} {r.text}"
+    return r.json()
+
+
+def _gather(*calls):
+    """Run independent request thunks concurrently and return results in order."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        return [f.result() for f in [pool.submit(call) for call in calls]]
+
+
+def index_by(items, key):
+    """Index a list of JSON objects by one of their fields."""
+    return {i[key]: i for i in items}
 
 
 # ---------------------------------------------------------------------------
@@ -21,59 +100,96 @@ def base_url():
     return os.environ.get("TEST_BASE_URL", "http://localhost:8080")
 
 
-@pytest.fixture
-def unique_user(base_url: str):
-    """Create a fresh user, log in, and return credentials + auth headers."""
+@pytest.fixture(scope="session")
+def http():
+    """Shared HTTP session so every call reuses a pooled keep-alive connection."""
+    s = _TimeoutSession()
+    s.headers["Content-Type"] = "application/json"
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    yield s
+    s.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(http: requests.Session, base_url: str):
+    """Hit /health before any test so startup cost isn't billed to the first one.
+
+    Also acts as a readiness gate while the compose stack is still coming up.
+    """
+    for _ in range(3):
+        try:
+            if http.get(f"{base_url}/health", timeout=2).ok:
+                break
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+
+
+@pytest.fixture(scope="module")
+def unique_user(http: requests.Session, base_url: str):
+    """Create a user once per module, log in, and return its email + auth headers.
+
+    Tests must not depend on the user being otherwise untouched; anything they
+    create (aliases, keys) is named via ``_uid()``, which is unique per process
+    and scoped to this module's user, so sharing the user is safe.
+    """
+    # Users persist in the DB across runs, so the email needs a random suffix
     uid = uuid.uuid4().hex[:12]
     email = f"test-{uid}@e2e.local"
     password = "TestPass123!"
 
     # Signup
-    r = requests.post(
+    r = _post(
+        http,
         f"{base_url}/auth/signup",
-        json={"email": email, "password": password},
+        payload={"email": email, "password": password},
     )
     assert r.status_code == 201, f"Signup failed: {r.status_code} {r.text}"
 
     # Login
-    r = requests.post(
+    r = _post(
+        http,
         f"{base_url}/auth/login",
-        json={"email": email, "password": password},
+        payload={"email": email, "password": password},
     )
     assert r.status_code == 200, f"Login failed: {r.status_code} {r.text}"
     token = r.json()["token"]
-    
-    # TODO: type
-    return {
-        "email": email,
-        "password": password,
-        "token": token,
-        "headers": {"Authorization": f"Bearer {token}"},
-    }
-
-
-@pytest.fixture
-def provider_key(base_url: str, unique_user):
-    """Create a provider key and return the provider list."""
-    r = requests.post(
+
+    return SimpleNamespace(
+        email=email,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+@pytest.fixture(scope="module")
+def provider_key(http: requests.Session, base_url: str, unique_user):
+    """Create a provider key once per module and return the provider list.
+
+    The list is shared by every test in the module, so it is returned as a
+    tuple; tests only read from it.
+    """
+    r = _post(
+        http,
         f"{base_url}/manage/providers",
-        headers=unique_user["headers"],
-        json={
+        headers=unique_user.headers,
+        payload={
             "provider": "openai",
-            "api_key": "sk-fake-test-key-" + uuid.uuid4().hex[:8],
+            "api_key": f"sk-fake-test-key-{_uid()}",
             "label": "E2E Test Key",
         },
     )
     assert r.status_code == 201, f"Create provider key failed: {r.status_code} {r.text}"
 
-    r = requests.get(
+    r = http.get(
         f"{base_url}/manage/providers",
-        headers=unique_user["headers"],
+        headers=unique_user.headers,
     )
     assert r.status_code == 200
     providers = r.json()
     assert len(providers) >= 1
-    return providers
+    return tuple(providers)
 
 
 # ---------------------------------------------------------------------------
@@ -82,27 +198,28 @@ def provider_key(base_url: str, unique_user):
 
 
 class TestAuthFlow:
-    def test_signup_login_me_apikey(self, base_url, unique_user):
-        headers = unique_user["headers"]
+    def test_signup_login_me_apikey(self, http, base_url, unique_user):
+        headers = unique_user.headers
 
-        # /auth/me
-        r = requests.get(f"{base_url}/auth/me", headers=headers)
-        assert r.status_code == 200
-        assert r.json()["email"] == unique_user["email"]
+        # /auth/me and API key generation don't depend on each other
+        me, key = _gather(
+            lambda: http.get(f"{base_url}/auth/me", headers=headers),
+            lambda: http.post(f"{base_url}/auth/key", headers=headers),
+        )
+        assert me.status_code == 200
+        assert me.json()["email"] == unique_user.email
 
-        # Generate API key
-        r = requests.post(f"{base_url}/auth/key", headers=headers)
-        assert r.status_code == 200
-        api_key = r.json()["token"]
+        assert key.status_code == 200
+        api_key = key.json()["token"]
         assert len(api_key) > 0
 
         # Use API key to hit /auth/me
-        r = requests.get(
+        r = http.get(
             f"{base_url}/auth/me",
             headers={"Authorization": f"Bearer {api_key}"},
         )
         assert r.status_code == 200
-        assert r.json()["email"] == unique_user["email"]
+        assert r.json()["email"] == unique_user.email
 
 
 # ---------------------------------------------------------------------------
@@ -111,12 +228,19 @@ class TestAuthFlow:
 
 
 class TestDuplicateSignup:
-    def test_duplicate_email_rejected(self, base_url, unique_user):
-        r = requests.post(
+    # Deliberately reuses the module-scoped unique_user: its signup already
+    # created the account, so every attempt here must hit the duplicate-email
+    # branch. Do not switch this to a fresh per-test user.
+    @pytest.mark.parametrize("attempt", ["second", "third"])
+    def test_duplicate_email_rejected(self, http, base_url, unique_user, attempt):
+        r = _post(
+            http,
             f"{base_url}/auth/signup",
-            json={"email": unique_user["email"], "password": "AnotherPass1!"},
+            payload={"email": unique_user.email, "password": "AnotherPass1!"},
+        )
+        assert r.status_code in (409, 500), (
+            f"Expected conflict on {attempt} signup, got {r.status_code}"
         )
-        assert r.status_code in (409, 500), f"Expected conflict, got {r.status_code}"
 
 
 # ---------------------------------------------------------------------------
@@ -125,21 +249,31 @@ class TestDuplicateSignup:
 
 
 class TestUnauthorized:
-    @pytest.mark.parametrize(
-        "method,path",
-        [
-            ("GET", "/auth/me"),
-            ("POST", "/auth/key"),
-            ("GET", "/manage/providers"),
-            ("POST", "/manage/providers"),
-            ("GET", "/manage/aliases"),
-            ("POST", "/manage/aliases"),
-            ("GET", "/manage/usage"),
-        ],
-    )
-    def test_protected_endpoints_require_auth(self, base_url, method, path):
-        r = requests.request(method, f"{base_url}{path}")
-        assert r.status_code == 401, f"{method} {path} returned {r.status_code}"
+    PROTECTED_ENDPOINTS = [
+        ("GET", "/auth/me"),
+        ("POST", "/auth/key"),
+        ("GET", "/manage/providers"),
+        ("POST", "/manage/providers"),
+        ("GET", "/manage/aliases"),
+        ("POST", "/manage/aliases"),
+        ("GET", "/manage/usage"),
+    ]
+
+    def test_protected_endpoints_require_auth(self, http, base_url):
+        # The calls are independent, so issue them in parallel on the shared session
+        responses = _gather(
+            *[
+                lambda method=method, path=path: http.request(method, f"{base_url}{path}")
+                for method, path in self.PROTECTED_ENDPOINTS
+            ]
+        )
+
+        failures = [
+            f"{method} {path} returned {r.status_code}"
+            for (method, path), r in zip(self.PROTECTED_ENDPOINTS, responses)
+            if r.status_code != 401
+        ]
+        assert not failures, "; ".join(failures)
 
 
 # ---------------------------------------------------------------------------
@@ -165,224 +299,159 @@ class TestProviderKeys:
 
 
 class TestAliasCRUD:
-    def test_create_and_list(self, base_url, unique_user, provider_key):
-        headers = unique_user["headers"]
+    def test_create_and_list(self, http, base_url, unique_user, provider_key):
+        headers = unique_user.headers
         pk_id = provider_key[0]["id"]
 
-        alias_name = f"test-alias-{uuid.uuid4().hex[:8]}"
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": alias_name,
-                "target_model": "gpt-4",
-                "provider_key_id": pk_id,
-            },
-        )
+        alias_name = f"test-alias-{_uid()}"
+        r = _create_alias(http, base_url, headers, alias_name, "gpt-4", pk_id)
         assert r.status_code == 200, f"Create alias failed: {r.text}"
+        created = r.json()
+        assert created["alias"] == alias_name
 
-        r = requests.get(f"{base_url}/manage/aliases", headers=headers)
+        r = http.get(f"{base_url}/manage/aliases", headers=headers)
         assert r.status_code == 200
-        aliases = r.json()
-        match = [a for a in aliases if a["alias"] == alias_name]
-        assert len(match) == 1
-        a = match[0]
+        by_name = index_by(r.json(), "alias")
+        assert alias_name in by_name
+        a = by_name[alias_name]
         assert a["target_model"] == "gpt-4"
         assert a["provider_key_id"] == pk_id
-        assert "id" in a
+        assert a["id"] == created["id"]
 
 
 # ---------------------------------------------------------------------------
-# 6. Alias with null optionals
+# 6. Alias optional field normalization
 # ---------------------------------------------------------------------------
 
 
-class TestAliasNullOptionals:
-    def test_explicit_nulls(self, base_url, unique_user, provider_key):
-        headers = unique_user["headers"]
-        pk_id = provider_key[0]["id"]
-        alias_name = f"null-opt-{uuid.uuid4().hex[:8]}"
-
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": alias_name,
-                "target_model": "gpt-4",
-                "provider_key_id": pk_id,
-                "fallback_alias_id": None,
-                "light_model": None,
-            },
-        )
-        assert r.status_code == 200
-
-        r = requests.get(f"{base_url}/manage/aliases", headers=headers)
-        aliases = r.json()
-        match = [a for a in aliases if a["alias"] == alias_name][0]
-        assert match["fallback_alias_id"] is None
-        assert match["light_model"] is None
-
-
-# ---------------------------------------------------------------------------
-# 7. Alias with zero/empty optionals (bug regression)
-# ---------------------------------------------------------------------------
-
-
-class TestAliasZeroEmptyOptionals:
-    def test_zero_and_empty_normalized_to_null(self, base_url, unique_user, provider_key):
-        """Backend should normalize fallback_alias_id=0 and light_model='' to null."""
-        headers = unique_user["headers"]
+class TestAliasOptionals:
+    @pytest.mark.parametrize(
+        "fb_in,lm_in,fb_out,lm_out",
+        [
+            pytest.param(None, None, None, None, id="explicit-nulls"),
+            # Bug regression: zero/empty must be normalized to null
+            pytest.param(0, "", None, None, id="zero-and-empty"),
+            pytest.param(None, "gpt-3.5-turbo", None, "gpt-3.5-turbo", id="light-model-kept"),
+        ],
+    )
+    def test_optional_normalization(
+        self, http, base_url, unique_user, provider_key, fb_in, lm_in, fb_out, lm_out
+    ):
         pk_id = provider_key[0]["id"]
-        alias_name = f"zero-opt-{uuid.uuid4().hex[:8]}"
-
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": alias_name,
-                "target_model": "gpt-4",
-                "provider_key_id": pk_id,
-                "fallback_alias_id": 0,
-                "light_model": "",
-            },
+        alias_name = f"opt-{_uid()}"
+
+        r = _create_alias(
+            http,
+            base_url,
+            unique_user.headers,
+            alias_name,
+            "gpt-4",
+            pk_id,
+            fallback_alias_id=fb_in,
+            light_model=lm_in,
         )
         assert r.status_code == 200
 
-        r = requests.get(f"{base_url}/manage/aliases", headers=headers)
-        aliases = r.json()
-        match = [a for a in aliases if a["alias"] == alias_name][0]
-        assert match["fallback_alias_id"] is None, (
-            f"Expected null, got {match['fallback_alias_id']}"
+        # Check the stored row, not the handler's echo of the normalized request
+        match = _get_alias(http, base_url, unique_user.headers, alias_name)
+        assert match["fallback_alias_id"] == fb_out, (
+            f"Expected {fb_out!r}, got {match['fallback_alias_id']!r}"
         )
-        assert match["light_model"] is None, (
-            f"Expected null, got {match['light_model']}"
+        assert match["light_model"] == lm_out, (
+            f"Expected {lm_out!r}, got {match['light_model']!r}"
         )
 
 
 # ---------------------------------------------------------------------------
-# 8. Alias upsert
+# 7. Alias upsert
 # ---------------------------------------------------------------------------
 
 
 class TestAliasUpsert:
-    def test_upsert_updates_existing(self, base_url, unique_user, provider_key):
-        headers = unique_user["headers"]
+    def test_upsert_updates_existing(self, http, base_url, unique_user, provider_key):
+        headers = unique_user.headers
         pk_id = provider_key[0]["id"]
-        alias_name = f"upsert-{uuid.uuid4().hex[:8]}"
+        alias_name = f"upsert-{_uid()}"
 
         # Create
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": alias_name,
-                "target_model": "gpt-4",
-                "provider_key_id": pk_id,
-            },
-        )
+        r = _create_alias(http, base_url, headers, alias_name, "gpt-4", pk_id)
         assert r.status_code == 200
+        created_id = r.json()["id"]
 
         # Upsert with different target
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": alias_name,
-                "target_model": "gpt-4-turbo",
-                "provider_key_id": pk_id,
-            },
-        )
+        r = _create_alias(http, base_url, headers, alias_name, "gpt-4-turbo", pk_id)
         assert r.status_code == 200
 
-        r = requests.get(f"{base_url}/manage/aliases", headers=headers)
-        aliases = r.json()
-        match = [a for a in aliases if a["alias"] == alias_name]
-        assert len(match) == 1, "Upsert should not create a duplicate"
-        assert match[0]["target_model"] == "gpt-4-turbo"
+        assert r.json()["id"] == created_id, "Upsert should not create a duplicate"
+
+        match = _get_alias(http, base_url, headers, alias_name)
+        assert match["target_model"] == "gpt-4-turbo"
 
 
 # ---------------------------------------------------------------------------
-# 9. Alias PATCH
+# 8. Alias PATCH
 # ---------------------------------------------------------------------------
 
 
 class TestAliasPatch:
-    def test_patch_specific_fields(self, base_url, unique_user, provider_key):
-        headers = unique_user["headers"]
+    def test_patch_specific_fields(self, http, base_url, unique_user, provider_key):
+        headers = unique_user.headers
         pk_id = provider_key[0]["id"]
-        alias_name = f"patch-{uuid.uuid4().hex[:8]}"
+        alias_name = f"patch-{_uid()}"
 
         # Create
-        requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": alias_name,
-                "target_model": "gpt-4",
-                "provider_key_id": pk_id,
-            },
-        )
+        _create_alias(http, base_url, headers, alias_name, "gpt-4", pk_id)
 
         # Patch target_model
-        r = requests.patch(
+        r = http.patch(
             f"{base_url}/manage/aliases/{alias_name}",
             headers=headers,
             json={"target_model": "gpt-4o"},
         )
         assert r.status_code == 200
 
-        r = requests.get(f"{base_url}/manage/aliases", headers=headers)
-        aliases = r.json()
-        match = [a for a in aliases if a["alias"] == alias_name][0]
+        # PATCH responds with the row reloaded from the database
+        match = r.json()
         assert match["target_model"] == "gpt-4o"
+        assert match["provider_key_id"] == pk_id
 
 
 # ---------------------------------------------------------------------------
-# 10. Alias with advanced options
+# 9. Alias with advanced options
 # ---------------------------------------------------------------------------
 
 
 class TestAliasAdvanced:
-    def test_light_model_and_fallback(self, base_url, unique_user, provider_key):
-        headers = unique_user["headers"]
+    def test_light_model_and_fallback(self, http, base_url, unique_user, provider_key):
+        headers = unique_user.headers
         pk_id = provider_key[0]["id"]
 
         # Create a fallback alias first
-        fallback_name = f"fb-{uuid.uuid4().hex[:8]}"
-        requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": fallback_name,
-                "target_model": "gpt-3.5-turbo",
-                "provider_key_id": pk_id,
-            },
-        )
-
-        # Get its ID
-        r = requests.get(f"{base_url}/manage/aliases", headers=headers)
-        fb = [a for a in r.json() if a["alias"] == fallback_name][0]
-        fb_id = fb["id"]
+        fallback_name = f"fb-{_uid()}"
+        r = _create_alias(http, base_url, headers, fallback_name, "gpt-3.5-turbo", pk_id)
+        assert r.status_code == 200
+        fb_id = r.json()["id"]
 
         # Create alias with all advanced options
-        alias_name = f"adv-{uuid.uuid4().hex[:8]}"
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=headers,
-            json={
-                "alias": alias_name,
-                "target_model": "gpt-4",
-                "provider_key_id": pk_id,
-                "fallback_alias_id": fb_id,
-                "use_light_model": True,
-                "light_model_threshold": 50,
-                "light_model": "gpt-3.5-turbo",
-            },
+        alias_name = f"adv-{_uid()}"
+        r = _create_alias(
+            http,
+            base_url,
+            headers,
+            alias_name,
+            "gpt-4",
+            pk_id,
+            fallback_alias_id=fb_id,
+            use_light_model=True,
+            light_model_threshold=50,
+            light_model="gpt-3.5-turbo",
         )
         assert r.status_code == 200
+        assert r.json()["fallback_alias_id"] == fb_id
 
-        r = requests.get(f"{base_url}/manage/aliases", headers=headers)
-        match = [a for a in r.json() if a["alias"] == alias_name][0]
+        # The POST echoes the request; read the row back to confirm the
+        # fallback link and light-model settings were persisted.
+        match = _get_alias(http, base_url, headers, alias_name)
         assert match["fallback_alias_id"] == fb_id
         assert match["use_light_model"] is True
         assert match["light_model_threshold"] == 50
@@ -390,55 +459,39 @@ class TestAliasAdvanced:
 
 
 # ---------------------------------------------------------------------------
-# 11. Alias validation
+# 10. Alias validation
 # ---------------------------------------------------------------------------
 
 
 class TestAliasValidation:
-    def test_missing_alias_name(self, base_url, unique_user, provider_key):
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=unique_user["headers"],
-            json={
-                "target_model": "gpt-4",
-                "provider_key_id": provider_key[0]["id"],
-            },
-        )
-        assert r.status_code == 400
-
-    def test_missing_target_model(self, base_url, unique_user, provider_key):
-        r = requests.post(
-            f"{base_url}/manage/aliases",
-            headers=unique_user["headers"],
-            json={
-                "alias": "val-test",
-                "provider_key_id": provider_key[0]["id"],
-            },
-        )
-        assert r.status_code == 400
-
-    def test_missing_provider_key(self, base_url, unique_user):
-        r = requests.post(
+    @pytest.mark.parametrize("missing", ["alias", "target_model", "provider_key_id"])
+    def test_missing_required_field(self, http, base_url, unique_user, provider_key, missing):
+        payload = {
+            "alias": "val-test",
+            "target_model": "gpt-4",
+            "provider_key_id": provider_key[0]["id"],
+        }
+        del payload[missing]
+
+        r = _post(
+            http,
             f"{base_url}/manage/aliases",
-            headers=unique_user["headers"],
-            json={
-                "alias": "val-test",
-                "target_model": "gpt-4",
-            },
+            headers=unique_user.headers,
+            payload=payload,
         )
-        assert r.status_code == 400
+        assert r.status_code == 400, f"Missing {missing} returned {r.status_code}"
 
 
 # ---------------------------------------------------------------------------
-# 12. Usage stats
+# 11. Usage stats
 # ---------------------------------------------------------------------------
 
 
 class TestUsageStats:
-    def test_usage_returns_list(self, base_url, unique_user):
-        r = requests.get(
+    def test_usage_returns_list(self, http, base_url, unique_user):
+        r = http.get(
             f"{base_url}/manage/usage",
-            headers=unique_user["headers"],
+            headers=unique_user.headers,
         )
         assert r.status_code == 200
         # New user should have null (no rows) or empty list
@@ -91,10 +91,10 @@ func TestProxyEndToEnd(t *testing.T) {
 
 	// Expect DB calls for ProxyHandler
 	// 1. Model Alias
-	mockDB.ExpectQuery("SELECT target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model FROM model_aliases").
+	mockDB.ExpectQuery("SELECT id, target_model, provider_key_id, fallback_alias_id, use_light_model, light_model_threshold, light_model FROM model_aliases").
 		WithArgs(123, "gpt-4").
-		WillReturnRows(mockDB.NewRows([]string{"target_model", "provider_key_id", "fallback_alias_id", "use_light_model", "light_model_threshold", "light_model"}).
-			AddRow("claude-3-opus-20240229", 10, nil, false, 100, nil))
+		WillReturnRows(mockDB.NewRows([]string{"id", "target_model", "provider_key_id", "fallback_alias_id", "use_light_model", "light_model_threshold", "light_model"}).
+			AddRow(1, "claude-3-opus-20240229", 10, nil, false, 100, nil))
 
 	// 2. Provider Key (Lookup for type)
 	mockDB.ExpectQuery("SELECT provider, encrypted_key FROM provider_keys").